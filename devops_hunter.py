@@ -4,7 +4,7 @@
 devops_hunter_auto.py — zero-argument DevOps scraper + HTML report
 
 Run once:
-  pip install aiohttp feedparser beautifulsoup4
+  pip install 'aiohttp[speedups]' feedparser beautifulsoup4 lxml pyahocorasick orjson
 
 Run:
   python devops_hunter_auto.py
@@ -21,33 +21,98 @@ Notes:
     * Crawling boards.greenhouse.io to discover company slugs, then using the Greenhouse API
     * Using Lever public search pages for devops/SRE/platform roles
   It also pulls DevOps/SRE blog posts via tag feeds and shows top GitHub repos.
+- GitHub and Greenhouse API responses are cached under data/.http_cache and
+  revalidated with ETags, so unchanged resources cost a 304 on later runs.
+  Entries no run has used for a week are pruned.
+  Feeds are revalidated the same way via data/feed_cache.json.
+- Set GITHUB_TOKEN to run the GitHub searches concurrently under the
+  authenticated rate limit; without it they run one at a time.
 """
 
-import os, sys, json, asyncio, logging, html, time, re
-from typing import Any, Dict, List, Optional, Set
+import os, sys, asyncio, logging, html, time, re, functools, hashlib, codecs, random
+from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 
+import ahocorasick
 import aiohttp
 import feedparser
-from bs4 import BeautifulSoup
+import orjson
+import lxml.html
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
+
+try:
+    import uvloop  # optional: libuv-based event loop, not available on Windows
+except ImportError:
+    uvloop = None
 
 # ---------------------------- Config (no args needed) -------------------------
 
 OUT_DIR = "./data"
-DEVOPS_KEYWORDS = [
+DEVOPS_KEYWORDS = (
     "devops", "sre", "site reliability", "platform engineering",
     "kubernetes", "k8s", "terraform", "ansible", "helm",
     "prometheus", "grafana", "observability", "otel", "on-call",
     "cicd", "ci/cd", "pipeline", "aws", "gcp", "azure"
-]
+)
+
+# One Aho-Corasick automaton finds every keyword in a single pass over the
+# text. Callers pass lowercased text, so the keys are lowercased here too.
+KEYWORD_AC = ahocorasick.Automaton()
+for _kw in DEVOPS_KEYWORDS:
+    KEYWORD_AC.add_word(_kw.lower(), _kw)
+KEYWORD_AC.make_automaton()
+
+GITHUB_TERMS = (
+    "awesome+devops",
+    "awesome+sre",
+    "platform+engineering",
+    "site+reliability+engineering",
+    "kubernetes+production+best+practices",
+    "terraform+modules",
+    "cicd+best+practices",
+)
+LEVER_QUERIES = ("devops", "site%20reliability", "platform%20engineer", "sre")
+# CNCF & ecosystem staples (stable)
+STAPLE_FEEDS = (
+    "https://kubernetes.io/feed.xml",
+    "https://kubernetes.io/blog/index.xml",
+    "https://prometheus.io/blog/index.xml",
+    "https://grafana.com/blog/index.xml",
+    "https://www.cncf.io/feed/",
+    "https://www.hashicorp.com/blog/feed.xml",
+    "https://about.gitlab.com/atom.xml",
+    "https://circleci.com/blog/index.xml",
+)
+# dev.to / medium tag feeds for every keyword plus the staples, built once
+DEV_TAG_FEEDS = tuple(sorted({
+    f"https://{host}/feed/tag/{kw.replace(' ', '')}"
+    for kw in DEVOPS_KEYWORDS for host in ("dev.to", "medium.com")
+}.union(STAPLE_FEEDS)))
 
 # Crawl limiters so a single run completes quickly
 GREENHOUSE_MAX_PAGES = 8      # pages to crawl on boards.greenhouse.io (sane cap)
 GREENHOUSE_MAX_SLUGS = 120    # validate at most this many slugs
+HTTP_PER_HOST = 8             # pooled connections per host (TCPConnector limit_per_host)
+# Every board request goes to one host; a task beyond the pool would only wait
+# for a connection, and that wait counts against its FETCH_TIMEOUT
+GREENHOUSE_CONCURRENCY = HTTP_PER_HOST
 LEVER_MAX_PAGES_PER_QUERY = 1 # keep tight for speed
 GITHUB_PER_TERM = 8           # per search term
+FEED_CONCURRENCY = 8          # feeds downloaded/parsed at once
+GITHUB_CONCURRENCY = 3        # parallel searches when GITHUB_TOKEN is set
+GITHUB_RETRIES = 2            # retries on 403/429 (rate limit)
 
+USER_AGENT = "DevOpsHunter/auto"
 HTTP_TIMEOUT = aiohttp.ClientTimeout(total=120, connect=20, sock_read=60)
+# Per request: one hung host must not hold a slot for the whole session timeout
+FETCH_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=20, sock_read=10)
+FETCH_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, ValueError)  # ValueError: bad JSON
+HTTP_RETRIES = 2              # extra attempts on 5xx responses
+HTTP_CACHE_DIR = os.path.join(OUT_DIR, ".http_cache")  # ETag-revalidated JSON bodies
+HTTP_CACHE_MAX_AGE = 7 * 86400  # seconds; entries unused for longer are pruned
+FEED_CACHE_PATH = os.path.join(OUT_DIR, "feed_cache.json")  # validators + posts per feed
 
 # ---------------------------- Logging ----------------------------------------
 
@@ -61,57 +126,196 @@ def mkdir_p(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
 def save_json(path: str, data: Any) -> None:
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    with open(path, "wb") as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+
+def load_json(path: str, default: Any) -> Any:
+    try:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return default
+
+def keyword_score(text: str) -> int:
+    # Number of distinct DEVOPS_KEYWORDS occurring in (lowercased) text
+    return len({kw for _, kw in KEYWORD_AC.iter(text)})
+
+def has_keyword(text: str) -> bool:
+    # Stops at the first DEVOPS_KEYWORDS hit in (lowercased) text
+    return next(KEYWORD_AC.iter(text), None) is not None
 
 # ---------------------------- HTTP helpers -----------------------------------
 
+async def retry_pause(attempt: int) -> None:
+    # Exponential backoff with full jitter, so retries don't arrive in lockstep
+    await asyncio.sleep(random.uniform(0, 0.5 * 2 ** attempt))
+
 async def fetch_text(session: aiohttp.ClientSession, url: str) -> str:
-    try:
-        async with session.get(url) as r:
-            if r.status == 200:
-                return await r.text()
+    for attempt in range(HTTP_RETRIES + 1):
+        try:
+            async with session.get(url, timeout=FETCH_TIMEOUT) as r:
+                if r.status >= 500 and attempt < HTTP_RETRIES:
+                    pass  # transient server error: retry below
+                elif r.status != 200:
+                    return ""
+                else:
+                    # Use the declared charset, else UTF-8: no charset sniffing, and a
+                    # stray bad byte is replaced instead of discarding the whole page
+                    encoding = r.charset or "utf-8"
+                    try:
+                        codecs.lookup(encoding)
+                    except LookupError:
+                        encoding = "utf-8"
+                    return await r.text(encoding=encoding, errors="replace")
+        except FETCH_ERRORS:
             return ""
-    except Exception:
+        await retry_pause(attempt)
+    return ""
+
+def http_cache_path(url: str, ext: str) -> str:
+    return os.path.join(HTTP_CACHE_DIR, hashlib.sha1(url.encode("utf-8")).hexdigest() + ext)
+
+def http_cache_etag(url: str) -> str:
+    try:
+        with open(http_cache_path(url, ".etag"), encoding="utf-8") as f:
+            return f.read().strip()
+    except OSError:
         return ""
 
+def http_cache_body(url: str) -> bytes:
+    try:
+        with open(http_cache_path(url, ".body"), "rb") as f:
+            return f.read()
+    except OSError:
+        return b""
+
+def http_cache_store(url: str, etag: str, body: bytes) -> None:
+    mkdir_p(HTTP_CACHE_DIR)
+    # Body first: an ETag must never point at a missing body
+    with open(http_cache_path(url, ".body"), "wb") as f:
+        f.write(body)
+    with open(http_cache_path(url, ".etag"), "w", encoding="utf-8") as f:
+        f.write(etag)
+
+def http_cache_touch(url: str) -> None:
+    # Mark an entry as used by this run so http_cache_prune() keeps it
+    for ext in (".etag", ".body"):
+        try:
+            os.utime(http_cache_path(url, ext))
+        except OSError:
+            pass
+
+def http_cache_prune(max_age: float = HTTP_CACHE_MAX_AGE) -> None:
+    # Boards and searches that no run asks for anymore would pile up forever
+    # (full content=true dumps); drop files not stored or hit for max_age
+    cutoff = time.time() - max_age
+    try:
+        entries = list(os.scandir(HTTP_CACHE_DIR))
+    except OSError:
+        return
+    for e in entries:
+        try:
+            if e.is_file() and e.stat().st_mtime < cutoff:
+                os.remove(e.path)
+        except OSError:
+            pass
+
+def http_cache_drop(url: str) -> None:
+    # Validator first, so a half-dropped entry is never revalidated
+    for ext in (".etag", ".body"):
+        try:
+            os.remove(http_cache_path(url, ext))
+        except OSError:
+            pass
+
+async def get_with_retries(session: aiohttp.ClientSession, url: str,
+                           headers: Dict[str, str]) -> Tuple[int, bytes, Any]:
+    # GET, retrying 5xx responses; the body is only read on a 200
+    for attempt in range(HTTP_RETRIES + 1):
+        async with session.get(url, headers=headers, timeout=FETCH_TIMEOUT) as r:
+            status, resp_headers = r.status, r.headers
+            body = await r.read() if status == 200 else b""
+        if status < 500 or attempt == HTTP_RETRIES:
+            break
+        await retry_pause(attempt)
+    return status, body, resp_headers
+
+async def get_json_cached(session: aiohttp.ClientSession, url: str,
+                          headers: Optional[Dict[str, str]] = None) -> Tuple[int, Any, Any]:
+    # GET + If-None-Match against the disk cache; a 304 comes back as 200 with
+    # the cached body. 5xx responses are retried. Returns (status, data,
+    # headers); network and decode errors (FETCH_ERRORS) propagate.
+    hdrs = dict(headers or {})
+    etag = await asyncio.to_thread(http_cache_etag, url)
+    if etag:
+        hdrs["If-None-Match"] = etag
+    status, body, resp_headers = await get_with_retries(session, url, hdrs)
+    if status == 304 and etag:
+        body = await asyncio.to_thread(http_cache_body, url)
+        try:
+            data = orjson.loads(body)
+        except orjson.JSONDecodeError:
+            # Cached body missing or corrupt: forget the validator and fetch in full,
+            # otherwise every later run would get the same useless 304
+            await asyncio.to_thread(http_cache_drop, url)
+            del hdrs["If-None-Match"]
+            status, body, resp_headers = await get_with_retries(session, url, hdrs)
+        else:
+            await asyncio.to_thread(http_cache_touch, url)
+            return 200, data, resp_headers
+    if status != 200:
+        return status, None, resp_headers
+    data = orjson.loads(body)
+    new_etag = resp_headers.get("ETag", "")
+    if new_etag:
+        await asyncio.to_thread(http_cache_store, url, new_etag, body)
+    return status, data, resp_headers
+
 async def fetch_json(session: aiohttp.ClientSession, url: str) -> Dict[str, Any]:
     try:
-        async with session.get(url) as r:
-            if r.status == 200:
-                return await r.json()
-            return {}
-    except Exception:
+        status, data, _ = await get_json_cached(session, url)
+    except FETCH_ERRORS:
         return {}
+    return data if status == 200 and isinstance(data, dict) else {}
 
 # ---------------------------- GitHub -----------------------------------------
 
+async def github_search(session: aiohttp.ClientSession, term: str,
+                        headers: Dict[str, str], sem: asyncio.Semaphore) -> List[Dict]:
+    url = ("https://api.github.com/search/repositories"
+           f"?q={term}+in:name,description,readme&sort=stars&order=desc"
+           f"&per_page={GITHUB_PER_TERM}")  # only fetch the items we keep
+    for attempt in range(GITHUB_RETRIES + 1):
+        async with sem:
+            try:
+                status, data, resp_headers = await get_json_cached(session, url, headers)
+            except FETCH_ERRORS:
+                return []
+            if status == 200:
+                return data.get("items", []) if isinstance(data, dict) else []
+            if status not in (403, 429):
+                return []
+            retry_after = resp_headers.get("Retry-After", "")
+            # Rate limited: back off while holding the slot so siblings wait too
+            if attempt < GITHUB_RETRIES:
+                delay = int(retry_after) if retry_after.isdigit() else 2 ** attempt * 5
+                await asyncio.sleep(min(delay, 60))
+    return []
+
 async def github_repos(session: aiohttp.ClientSession) -> List[Dict]:
-    terms = [
-        "awesome+devops",
-        "awesome+sre",
-        "platform+engineering",
-        "site+reliability+engineering",
-        "kubernetes+production+best+practices",
-        "terraform+modules",
-        "cicd+best+practices",
-    ]
     headers = {
         "Accept": "application/vnd.github.v3+json",
-        "User-Agent": "DevOpsHunter/auto"
+        "User-Agent": USER_AGENT
     }
+    token = os.environ.get("GITHUB_TOKEN")
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    # Authenticated searches can run side by side; anonymous ones go one at a time
+    sem = asyncio.Semaphore(GITHUB_CONCURRENCY if token else 1)
+    pages = await asyncio.gather(*(github_search(session, t, headers, sem) for t in GITHUB_TERMS))
     results: List[Dict] = []
-    for term in terms:
-        url = ("https://api.github.com/search/repositories"
-               f"?q={term}+in:name,description,readme&sort=stars&order=desc")
-        try:
-            async with session.get(url, headers=headers, timeout=HTTP_TIMEOUT) as r:
-                if r.status != 200:
-                    continue
-                data = await r.json()
-        except Exception:
-            continue
-        for repo in data.get("items", [])[:GITHUB_PER_TERM]:
+    for term, items in zip(GITHUB_TERMS, pages):
+        for repo in items[:GITHUB_PER_TERM]:
             if repo.get("stargazers_count", 0) < 20:
                 continue
             results.append({
@@ -125,131 +329,206 @@ async def github_repos(session: aiohttp.ClientSession) -> List[Dict]:
                 "source": "github",
                 "term": term
             })
-        await asyncio.sleep(1.0)
     # Dedup + sort
-    seen, unique = set(), []
-    for r in results:
-        if r["url"] not in seen:
-            seen.add(r["url"])
-            unique.append(r)
+    unique = list({r["url"]: r for r in results}.values())
     unique.sort(key=lambda x: x.get("stars", 0), reverse=True)
     return unique
 
 # ---------------------------- Blogs / Feeds ----------------------------------
 
-def dev_tag_feeds() -> List[str]:
-    feeds = []
-    for kw in DEVOPS_KEYWORDS:
-        tag = kw.replace(" ", "")
-        feeds.append(f"https://dev.to/feed/tag/{tag}")
-        feeds.append(f"https://medium.com/feed/tag/{tag}")
-    # CNCF & ecosystem staples (stable)
-    feeds += [
-        "https://kubernetes.io/feed.xml",
-        "https://kubernetes.io/blog/index.xml",
-        "https://prometheus.io/blog/index.xml",
-        "https://grafana.com/blog/index.xml",
-        "https://www.cncf.io/feed/",
-        "https://www.hashicorp.com/blog/feed.xml",
-        "https://about.gitlab.com/atom.xml",
-        "https://circleci.com/blog/index.xml",
-    ]
-    # Dedup
-    return sorted(set(feeds))
-
-def blog_posts() -> List[Dict]:
-    feeds = dev_tag_feeds()
-    posts: List[Dict] = []
-    for url in feeds:
-        try:
-            feed = feedparser.parse(url)
-            for e in feed.entries[:15]:
-                title = getattr(e, "title", "") or ""
-                link = getattr(e, "link", "") or ""
-                desc = getattr(e, "summary", "") or getattr(e, "description", "") or ""
-                pub = getattr(e, "published", "") or getattr(e, "updated", "") or ""
-                if not link or not title:
-                    continue
-                text = f"{title} {desc}".lower()
-                score = sum(1 for k in DEVOPS_KEYWORDS if k in text)
-                if score == 0:
-                    continue
-                excerpt = BeautifulSoup(desc, "html.parser").get_text(" ", strip=True)[:600]
-                posts.append({
-                    "title": title,
-                    "url": link,
-                    "source": url.split('/')[2],
-                    "published": pub,
-                    "excerpt": excerpt,
-                    "relevance": score,
-                    "type": "blog_post"
-                })
-        except Exception:
+# Comments, script/style bodies and tags; a feed summary needs no parse tree.
+# Quotes only open an attribute value right after "=", as in a browser, and
+# a construct left open runs to the end of the text, so every "<" is matched
+# at most once and the scan stays linear. Possessive quantifiers never
+# backtrack into a run.
+HTML_STRIP_RE = re.compile(
+    r"""<!--.*?(?:-->|\Z)|<(script|style)\b.*?(?:</\1\s*>|\Z)"""
+    r"""|</?[A-Za-z!](?:[^>"'=]++|=\s*+(?:"[^"]*+"|'[^']*+')?|["'])*+(?:>|\Z)""",
+    re.S | re.I)
+
+def strip_html(s: str) -> str:
+    return " ".join(html.unescape(HTML_STRIP_RE.sub(" ", s)).split())
+
+@dataclass(slots=True)
+class BlogPost:
+    # Fixed schema for feed items; orjson serializes it natively
+    title: str
+    url: str
+    source: str
+    published: str        # as given by the feed
+    published_iso: str    # UTC, ISO 8601; "" when the feed date didn't parse
+    excerpt: str
+    relevance: int
+    type: str = "blog_post"
+
+def feed_posts(url: str, body: bytes, content_type: str) -> List[BlogPost]:
+    # Parse one feed and keep its relevant entries; runs in a worker thread.
+    # Sanitizing and URI resolution are skipped: excerpts are tag-stripped
+    # and everything is escaped again when the report is rendered.
+    # The headers stand in for the HTTP context feedparser no longer has:
+    # content-location is the base for relative entry links, and
+    # content-type carries the declared charset.
+    feed = feedparser.parse(body, response_headers={"content-location": url,
+                                                   "content-type": content_type},
+                            sanitize_html=False, resolve_relative_uris=False)
+    posts: List[BlogPost] = []
+    for e in feed.entries[:15]:
+        title = e.get("title") or ""
+        link = e.get("link") or ""
+        if not link or not title:
             continue
-    # Dedup and sort
-    seen, unique = set(), []
-    for p in posts:
-        if p["url"] not in seen:
-            seen.add(p["url"])
-            unique.append(p)
-    def parse_dt(s: str):
+        desc = e.get("summary") or e.get("description") or ""
+        pub = e.get("published") or e.get("updated") or ""
+        # feedparser already parsed the date into a UTC struct_time
+        pub_parsed = e.get("published_parsed") or e.get("updated_parsed")
+        text = f"{title} {desc}".lower()
+        score = keyword_score(text)
+        if score == 0:
+            continue
+        excerpt = strip_html(desc)[:600]
+        posts.append(BlogPost(
+            title=title,
+            url=link,
+            source=url.split('/')[2],
+            published=pub,
+            published_iso=datetime(*pub_parsed[:6]).isoformat() if pub_parsed else "",
+            excerpt=excerpt,
+            relevance=score,
+        ))
+    return posts
+
+async def fetch_feed(session: aiohttp.ClientSession, url: str, sem: asyncio.Semaphore,
+                     cached: Dict[str, Any]) -> Dict[str, Any]:
+    # Conditional GET; returns the feed's cache entry {"etag", "modified", "posts"}
+    headers = {}
+    if cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached.get("modified"):
+        headers["If-Modified-Since"] = cached["modified"]
+    async with sem:
         try:
-            tup = feedparser._parse_date(s)
-            if tup: return datetime(*tup[:6])
-        except Exception:
-            pass
+            async with session.get(url, headers=headers, timeout=FETCH_TIMEOUT) as r:
+                if r.status == 304 and cached:
+                    return cached  # unchanged: no body, no parse
+                if r.status >= 500:
+                    return cached
+                if r.status != 200:
+                    return {}
+                body = await r.read()
+                etag = r.headers.get("ETag", "")
+                modified = r.headers.get("Last-Modified", "")
+                content_type = r.headers.get("Content-Type", "")
+        except FETCH_ERRORS:
+            # A flaky host keeps last run's posts and validators instead of
+            # emptying its section and forcing a full refetch next time
+            return cached
+    # Parsing and extraction are blocking CPU work; keep them off the event loop
+    try:
+        posts = await asyncio.to_thread(feed_posts, url, body, content_type)
+    except Exception:
+        return {}
+    return {"etag": etag, "modified": modified, "posts": posts}
+
+def cached_feed(entry: Dict[str, Any]) -> Dict[str, Any]:
+    # Cache entries come back from JSON; rebuild the posts, or drop a stale schema
+    try:
+        posts = [BlogPost(**p) for p in entry.get("posts", [])]
+    except TypeError:
+        return {}
+    # Posts cached before links were resolved against the feed URL: refetch
+    if any(not p.url.startswith(("http://", "https://")) for p in posts):
+        return {}
+    return {**entry, "posts": posts}
+
+async def blog_posts(session: aiohttp.ClientSession) -> List[BlogPost]:
+    feeds = DEV_TAG_FEEDS
+    cache = await asyncio.to_thread(load_json, FEED_CACHE_PATH, {})
+    sem = asyncio.Semaphore(FEED_CONCURRENCY)
+    entries = await asyncio.gather(*(fetch_feed(session, url, sem, cached_feed(cache.get(url) or {}))
+                                     for url in feeds))
+    # Only feeds with a validator can answer 304 next time
+    await asyncio.to_thread(save_json, FEED_CACHE_PATH, {
+        url: e for url, e in zip(feeds, entries) if e.get("etag") or e.get("modified")
+    })
+    posts = [p for e in entries for p in e.get("posts", [])]
+    # Dedup and sort
+    unique = list({p.url: p for p in posts}.values())
     # Sort by relevance then date desc
-    unique.sort(key=lambda x: (x.get("relevance", 0), x.get("published", "")), reverse=True)
+    unique.sort(key=lambda x: (x.relevance, x.published_iso), reverse=True)
     return unique
 
 # ---------------------------- Jobs (Lever + Greenhouse) ----------------------
 
-async def lever_jobs(session: aiohttp.ClientSession) -> List[Dict]:
+def _xp_class(tag: str, cls: str) -> str:
+    # XPath equivalent of the CSS selector tag.cls
+    return f"{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')]"
+
+# Compiled once; each evaluation runs entirely inside libxml2
+LEVER_XPATH = {
+    "post": etree.XPath("//" + _xp_class("div", "posting")),
+    "title": etree.XPath("(.//h5)[1]"),
+    "link": etree.XPath(f"(.//{_xp_class('a', 'posting-btn-submit')})[1]"),
+    "company": etree.XPath(f"(.//{_xp_class('div', 'posting-company')})[1]"),
+    "location": etree.XPath(f"(.//{_xp_class('span', 'location')})[1]"),
+}
+
+def xpath_text(el: Any) -> str:
+    # Same result as BeautifulSoup's get_text(strip=True)
+    return "".join(s.strip() for s in el.itertext())
+
+async def lever_query(session: aiohttp.ClientSession, q: str, today: str) -> List[Dict]:
     base = "https://jobs.lever.co/search?commit=1&query="
-    queries = ["devops", "site%20reliability", "platform%20engineer", "sre"]
     out: List[Dict] = []
-    for q in queries:
-        for page in range(1, LEVER_MAX_PAGES_PER_QUERY+1):
-            url = f"{base}{q}&page={page}"
-            html_txt = await fetch_text(session, url)
-            if not html_txt:
+    for page in range(1, LEVER_MAX_PAGES_PER_QUERY+1):
+        if page > 1:
+            await asyncio.sleep(0.5)  # pages of one query stay sequential and polite
+        url = f"{base}{q}&page={page}"
+        html_txt = await fetch_text(session, url)
+        if not html_txt:
+            continue
+        try:
+            tree = lxml.html.fromstring(html_txt)
+        except (etree.ParserError, ValueError):  # ValueError: str with an XML encoding declaration
+            continue
+        cards = LEVER_XPATH["post"](tree)
+        if not cards:
+            break
+        for post in cards:
+            t = LEVER_XPATH["title"](post)
+            link = LEVER_XPATH["link"](post)
+            company = LEVER_XPATH["company"](post)
+            loc = LEVER_XPATH["location"](post)
+            title = xpath_text(t[0]) if t else ""
+            if not title or not link:
                 continue
-            soup = BeautifulSoup(html_txt, "html.parser")
-            cards = soup.select("div.posting")
-            if not cards:
-                break
-            for post in cards:
-                t = post.select_one("h5")
-                link = post.select_one("a.posting-btn-submit")
-                company = post.select_one("div.posting-company")
-                loc = post.select_one("span.location")
-                title = t.get_text(strip=True) if t else ""
-                if not title or not link:
-                    continue
-                out.append({
-                    "title": title,
-                    "company": (company.get_text(strip=True) if company else ""),
-                    "locations": [loc.get_text(strip=True)] if loc else [],
-                    "url": link.get("href", ""),
-                    "source": "lever",
-                    "date": datetime.utcnow().strftime("%Y-%m-%d"),
-                    "type": "job_listing"
-                })
-            await asyncio.sleep(0.5)
+            out.append({
+                "title": title,
+                "company": (xpath_text(company[0]) if company else ""),
+                "locations": [xpath_text(loc[0])] if loc else [],
+                "url": link[0].get("href", ""),
+                "source": "lever",
+                "date": today,
+                "type": "job_listing"
+            })
+    return out
+
+async def lever_jobs(session: aiohttp.ClientSession, today: str) -> List[Dict]:
+    per_query = await asyncio.gather(*(lever_query(session, q, today) for q in LEVER_QUERIES))
+    out = [j for batch in per_query for j in batch]
     # Dedup
-    seen, unique = set(), []
-    for j in out:
-        key = (j.get("company",""), j.get("title",""), j.get("url",""))
-        if key not in seen:
-            seen.add(key)
-            unique.append(j)
-    return unique
+    return list({(j["company"], j["title"], j["url"]): j for j in out}.values())
+
+# Path fragments that mark obvious non-board pages, matched in one regex search
+NON_BOARD_RE = re.compile("|".join(map(re.escape, [
+    "privacy", "terms", "blog", "post", "job", "login", "search", "about", "help"
+])))
 
 def looks_like_slug(path: str) -> bool:
     # Heuristic for greenhouse slugs (exclude obvious non-board paths)
-    return (len(path) > 1 and
-            not any(part in path for part in ["privacy", "terms", "blog", "post", "job", "login", "search", "about", "help"])
-           )
+    return len(path) > 1 and NON_BOARD_RE.search(path) is None
+
+# Only board links matter on the crawl pages; skip building the rest of the tree
+SLUG_STRAINER = SoupStrainer("a", href=re.compile(r"^/"))
 
 async def discover_greenhouse_slugs(session: aiohttp.ClientSession, max_pages: int = GREENHOUSE_MAX_PAGES) -> List[str]:
     slugs: List[str] = []
@@ -260,8 +539,8 @@ async def discover_greenhouse_slugs(session: aiohttp.ClientSession, max_pages: i
         html_txt = await fetch_text(session, url)
         if not html_txt:
             break
-        soup = BeautifulSoup(html_txt, "html.parser")
-        for a in soup.select('a[href^="/"]'):
+        soup = BeautifulSoup(html_txt, "lxml", parse_only=SLUG_STRAINER)
+        for a in soup.find_all("a"):
             href = a.get("href","").strip()
             if not href.startswith("/") or href == "/":
                 continue
@@ -269,71 +548,67 @@ async def discover_greenhouse_slugs(session: aiohttp.ClientSession, max_pages: i
             if looks_like_slug(slug):
                 slugs.append(slug)
         await asyncio.sleep(0.2)
-    # Make unique
-    uniq = []
-    seen: Set[str] = set()
-    for s in slugs:
-        if s not in seen:
-            seen.add(s)
-            uniq.append(s)
-    return uniq[:GREENHOUSE_MAX_SLUGS]
-
-async def greenhouse_jobs(session: aiohttp.ClientSession) -> List[Dict]:
-    slugs = await discover_greenhouse_slugs(session)
+    # Make unique (first occurrence keeps its position)
+    return list(dict.fromkeys(slugs))[:GREENHOUSE_MAX_SLUGS]
+
+def greenhouse_board_jobs(slug: str, data: Dict[str, Any], today: str) -> List[Dict]:
+    # Keyword-filter one board's jobs; descriptions are full HTML, so this is CPU work
     out: List[Dict] = []
-    for slug in slugs:
+    for j in data.get("jobs") or []:
+        title = j.get("title") or ""
+        desc = j.get("content","") or ""
+        if not title:
+            continue
+        # Most jobs are decided by the title; only lowercase the (large) HTML
+        # description when the title alone doesn't match
+        if not has_keyword(title.lower()) and not has_keyword(desc.lower()):
+            continue
+        loc = (j.get("location", {}) or {}).get("name", "")
+        url = j.get("absolute_url", "")
+        out.append({
+            "title": title,
+            "company": slug,
+            "locations": [loc] if loc else [],
+            "url": url,
+            "source": "greenhouse",
+            "date": today,
+            "type": "job_listing"
+        })
+    return out
+
+async def greenhouse_jobs(session: aiohttp.ClientSession, today: str) -> List[Dict]:
+    slugs = await discover_greenhouse_slugs(session)
+    sem = asyncio.Semaphore(GREENHOUSE_CONCURRENCY)
+
+    async def board(slug: str) -> List[Dict]:
         api = f"https://boards-api.greenhouse.io/v1/boards/{slug}/jobs?content=true"
-        data = await fetch_json(session, api)
-        jobs = data.get("jobs") or []
-        for j in jobs:
-            title = j.get("title") or ""
-            desc = j.get("content","") or ""
-            if not title:
-                continue
-            text = (title + " " + desc).lower()
-            if not any(k in text for k in DEVOPS_KEYWORDS):
-                continue
-            loc = (j.get("location", {}) or {}).get("name", "")
-            url = j.get("absolute_url", "")
-            out.append({
-                "title": title,
-                "company": slug,
-                "locations": [loc] if loc else [],
-                "url": url,
-                "source": "greenhouse",
-                "date": datetime.utcnow().strftime("%Y-%m-%d"),
-                "type": "job_listing"
-            })
-        await asyncio.sleep(0.15)
-    # Dedup
-    seen, unique = set(), []
-    for j in out:
-        key = (j.get("company",""), j.get("title",""), j.get("url",""))
-        if key not in seen:
-            seen.add(key)
-            unique.append(j)
-    return unique
+        async with sem:
+            data = await fetch_json(session, api)
+        # Scan off the event loop so other fetches keep progressing meanwhile
+        return await asyncio.to_thread(greenhouse_board_jobs, slug, data, today)
 
-async def job_listings() -> List[Dict]:
-    async with aiohttp.ClientSession(timeout=HTTP_TIMEOUT) as session:
-        lever, gh = await asyncio.gather(lever_jobs(session), greenhouse_jobs(session))
-    # Combine + filter by recency (tagged with today's date)
-    items = lever + gh
-    cutoff = datetime.utcnow() - timedelta(days=60)
-    fresh = []
-    for j in items:
-        try:
-            d = datetime.strptime(j.get("date",""), "%Y-%m-%d")
-        except Exception:
-            d = datetime.utcnow()
-        if d >= cutoff:
-            fresh.append(j)
+    boards = await asyncio.gather(*(board(s) for s in slugs))
+    out = [j for batch in boards for j in batch]
+    # Dedup
+    return list({(j["company"], j["title"], j["url"]): j for j in out}.values())
+
+async def job_listings(session: aiohttp.ClientSession) -> List[Dict]:
+    now = datetime.utcnow()
+    today = now.strftime("%Y-%m-%d")
+    cutoff = (now - timedelta(days=60)).strftime("%Y-%m-%d")
+    lever, gh = await asyncio.gather(lever_jobs(session, today), greenhouse_jobs(session, today))
+    # Combine + filter by recency (tagged with today's date).
+    # YYYY-MM-DD strings order like the dates they encode.
+    fresh = [j for j in lever + gh if j.get("date","") >= cutoff]
     # Sort by company,title
     fresh.sort(key=lambda x: (x.get("company",""), x.get("title","")))
     return fresh
 
 # ---------------------------- HTML Report ------------------------------------
 
+# Card fields repeat a lot (languages, hosts, companies); escape each value once
+_esc = functools.lru_cache(maxsize=4096)(html.escape)
+
 def html_head() -> str:
     return """<!doctype html><html lang="en"><head>
 <meta charset="utf-8"><meta name="viewport" content="width=device-width, initial-scale=1">
@@ -356,92 +631,132 @@ hr{border:none;border-top:1px solid #263252;margin:20px 0}
 .footer{margin-top:26px;color:var(--muted);font-size:12px}
 </style></head><body><div class="container">"""
 
-def html_section(title: str, items_html: str, count: int) -> str:
-    return f"""
-<div class="header"><h2>{html.escape(title)}</h2><span class="badge">{count}</span></div>
-<div class="grid">{items_html}</div>"""
+# Section header + grid opening tag; cards follow, then "</div>"
+SECTION_OPEN_TPL = """
+<div class="header"><h2>{title}</h2><span class="badge">{count}</span></div>
+<div class="grid">"""
 
-def repo_card(r: Dict) -> str:
-    topics = "".join(f'<span class="chip">{html.escape(t)}</span>' for t in (r.get("topics") or [])[:5])
-    desc = html.escape(r.get("description","")[:200])
-    return f"""
+REPORT_HEADER_TPL = '<h1>DevOps Report</h1><div class="small">Generated at {generated}</div><hr>'
+
+TOPIC_CHIP_TPL = '<span class="chip">{}</span>'
+
+def html_section_open(title: str, count: int) -> str:
+    return SECTION_OPEN_TPL.format_map({"title": _esc(title), "count": count})
+
+REPO_CARD_TPL = """
 <div class="card">
-  <div><a href="{html.escape(r.get('url',''))}" target="_blank"><strong>{html.escape(r.get('name',''))}</strong></a></div>
-  <div class="meta">★ {r.get('stars',0)} • {html.escape(r.get('language') or '')}</div>
+  <div><a href="{url}" target="_blank"><strong>{name}</strong></a></div>
+  <div class="meta">★ {stars} • {language}</div>
   <div class="small">{desc}</div>
   <div class="kv">{topics}</div>
 </div>"""
 
-def blog_card(p: Dict) -> str:
-    excerpt = html.escape((p.get("excerpt") or "")[:220])
-    pub = p.get("published") or ""
-    src = html.escape(p.get("source",""))
-    return f"""
+BLOG_CARD_TPL = """
 <div class="card">
-  <div><a href="{html.escape(p.get('url',''))}" target="_blank"><strong>{html.escape(p.get('title',''))}</strong></a></div>
-  <div class="meta">{src} • {html.escape(pub)}</div>
+  <div><a href="{url}" target="_blank"><strong>{title}</strong></a></div>
+  <div class="meta">{source} • {published}</div>
   <div class="small">{excerpt}</div>
 </div>"""
 
-def job_card(j: Dict) -> str:
-    locs = ", ".join(j.get("locations") or [])
-    return f"""
+JOB_CARD_TPL = """
 <div class="card">
-  <div><a href="{html.escape(j.get('url',''))}" target="_blank"><strong>{html.escape(j.get('title',''))}</strong></a></div>
-  <div class="meta">{html.escape(j.get('company',''))} • {html.escape(locs)}</div>
-  <div class="small">Source: {html.escape(j.get('source',''))} • {html.escape(j.get('date',''))}</div>
+  <div><a href="{url}" target="_blank"><strong>{title}</strong></a></div>
+  <div class="meta">{company} • {locations}</div>
+  <div class="small">Source: {source} • {date}</div>
 </div>"""
 
-def generate_html_report(data: Dict[str, Any], path: str) -> str:
-    head = html_head()
-    header = f'<h1>DevOps Report</h1><div class="small">Generated at {html.escape(ts())}</div><hr>'
-    body = ""
-    blogs = data.get("blog_posts", [])
-    repos = data.get("github_repos", [])
-    jobs  = data.get("job_listings", [])
-    
-    if blogs:
-        items = "".join(blog_card(p) for p in blogs[:40])
-        body += html_section("Recent Blog Posts", items, len(blogs))
-
-
-    if repos:
-        items = "".join(repo_card(r) for r in repos[:40])
-        body += html_section("Top GitHub Repos (DevOps/SRE/Platform)", items, len(repos))
-
+def repo_card(r: Dict) -> str:
+    return REPO_CARD_TPL.format_map({
+        "url": _esc(r.get("url","")),
+        "name": _esc(r.get("name","")),
+        "stars": r.get("stars",0),
+        "language": _esc(r.get("language") or ""),
+        "desc": _esc(r.get("description","")[:200]),
+        "topics": "".join(TOPIC_CHIP_TPL.format(_esc(t)) for t in (r.get("topics") or [])[:5]),
+    })
+
+def blog_card(p: BlogPost) -> str:
+    return BLOG_CARD_TPL.format_map({
+        "url": _esc(p.url),
+        "title": _esc(p.title),
+        "source": _esc(p.source),
+        "published": _esc(p.published),
+        "excerpt": _esc(p.excerpt[:220]),
+    })
 
-    if jobs:
-        items = "".join(job_card(j) for j in jobs[:40])
-        body += html_section("Job Listings", items, len(jobs))
+def job_card(j: Dict) -> str:
+    return JOB_CARD_TPL.format_map({
+        "url": _esc(j.get("url","")),
+        "title": _esc(j.get("title","")),
+        "company": _esc(j.get("company","")),
+        "locations": _esc(", ".join(j.get("locations") or [])),
+        "source": _esc(j.get("source","")),
+        "date": _esc(j.get("date","")),
+    })
 
-    footer = '<div class="footer">Made with devops_hunter_auto.py</div></div></body></html>'
-    doc = head + header + body + footer
+def generate_html_report(data: Dict[str, Any], path: str) -> str:
+    header = REPORT_HEADER_TPL.format_map({"generated": html.escape(ts())})
+    sections = [
+        ("Recent Blog Posts", blog_card, data.get("blog_posts", [])),
+        ("Top GitHub Repos (DevOps/SRE/Platform)", repo_card, data.get("github_repos", [])),
+        ("Job Listings", job_card, data.get("job_listings", [])),
+    ]
+    # Stream straight into the file; the whole document never sits in memory
     with open(path, "w", encoding="utf-8") as f:
-        f.write(doc)
+        f.write(html_head())
+        f.write(header)
+        for title, card, items in sections:
+            if not items:
+                continue
+            f.write(html_section_open(title, len(items)))
+            f.writelines(map(card, items[:40]))
+            f.write("</div>")
+        f.write('<div class="footer">Made with devops_hunter_auto.py</div></div></body></html>')
     return path
 
 # ---------------------------- Orchestration ----------------------------------
 
 async def main() -> None:
     mkdir_p(OUT_DIR)
-    async with aiohttp.ClientSession(timeout=HTTP_TIMEOUT) as session:
-        gh_repos = await github_repos(session)
-    blogs = blog_posts()
-    jobs = await job_listings()
-
-    save_json(os.path.join(OUT_DIR, "github_results_devops.json"), gh_repos)
-    save_json(os.path.join(OUT_DIR, "blog_results_devops.json"), blogs)
-    save_json(os.path.join(OUT_DIR, "job_results_devops.json"), jobs)
+    # One session for the whole run so keep-alive connections are reused
+    # Resolved hosts stay cached for the whole run (default TTL is only 10s)
+    connector = aiohttp.TCPConnector(limit=64, limit_per_host=HTTP_PER_HOST,
+                                     keepalive_timeout=60, ttl_dns_cache=600)
+    # Accept-Encoding is left to aiohttp: gzip/deflate always, plus br/zstd
+    # when the [speedups] extra is installed, all decompressed transparently
+    async with aiohttp.ClientSession(timeout=HTTP_TIMEOUT, connector=connector,
+                                     headers={"User-Agent": USER_AGENT}) as session:
+        # The three pipelines hit disjoint hosts; overlap them end to end
+        names = ("github_repos", "blog_posts", "job_listings")
+        results = await asyncio.gather(
+            github_repos(session), blog_posts(session), job_listings(session),
+            return_exceptions=True)
+    # A failing pipeline must not throw away what the other two collected
+    collected: List[List[Any]] = []
+    for name, res in zip(names, results):
+        if isinstance(res, Exception):
+            log.warning("%s failed: %r", name, res)
+            res = []
+        elif isinstance(res, BaseException):
+            raise res  # cancellation / interrupts still propagate
+        collected.append(res)
+    gh_repos, blogs, jobs = collected
 
     combined = {"generated_at": ts(),"blog_posts": blogs, "github_repos": gh_repos,  "job_listings": jobs}
-    save_json(os.path.join(OUT_DIR, "devops_combined.json"), combined)
-
     report_path = os.path.join(OUT_DIR, "devops_report.html")
-    generate_html_report(combined, report_path)
+    # Outputs are independent files; write them side by side
+    await asyncio.gather(
+        asyncio.to_thread(save_json, os.path.join(OUT_DIR, "github_results_devops.json"), gh_repos),
+        asyncio.to_thread(save_json, os.path.join(OUT_DIR, "blog_results_devops.json"), blogs),
+        asyncio.to_thread(save_json, os.path.join(OUT_DIR, "job_results_devops.json"), jobs),
+        asyncio.to_thread(save_json, os.path.join(OUT_DIR, "devops_combined.json"), combined),
+        asyncio.to_thread(generate_html_report, combined, report_path),
+        asyncio.to_thread(http_cache_prune),
+    )
     print(f"\n✅ Done. Open: {report_path}\n")
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        (uvloop.run if uvloop else asyncio.run)(main())
     except KeyboardInterrupt:
         print("Interrupted.")